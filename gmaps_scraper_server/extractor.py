@@ -27,28 +27,264 @@ DATA SOURCES:
 1. JSON (window.APP_INITIALIZATION_STATE): Only 4 fields available
    - place_id, cid (internal ID), name, coordinates
 2. HTML DOM: Required for all other fields
-   - Extracted using stability-prioritized patterns
+   - Parsed once with selectolax (when installed) for semantic attribute lookups
+   - Extracted using stability-prioritized regex patterns as fallback
 
 Last Updated: 2026-02-13
 """
 
+import copy
 import json
 import re
 import logging
+import hashlib
+import threading
+from collections import OrderedDict
+from html import unescape
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional: fall back to regex-only extraction
+    LexborHTMLParser = None
+
+try:
+    import re2
+except ImportError:  # Optional: fall back to the stdlib regex engine
+    re2 = None
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib JSON decoder
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:  # Optional: fall back to decoding the whole document
+    simdjson = None
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# --- Result Cache ---
+# Extraction results keyed by a digest of the HTML, so re-fetched pages skip the
+# regex sweep. Keys are 16-byte digests: the cache never holds the HTML itself.
+RESULT_CACHE_SIZE = 4096
+_result_cache = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+# --- Precompiled Patterns ---
+# Compiled once at import so the per-document sweep doesn't pay for regex cache
+# lookups (or recompiles after cache eviction) on every extraction call.
+_HTML_FLAGS = re.DOTALL | re.IGNORECASE
+
+def _compile_html(pattern, flags=_HTML_FLAGS):
+    """
+    Compiles a pattern that scans the whole HTML document.
+    Uses RE2's linear-time DFA when installed: unlike sre it keeps its literal-prefix
+    scan under IGNORECASE, which makes full-page searches roughly 10x faster.
+    Patterns applied to short extracted strings stay on the stdlib engine, where
+    RE2's per-call overhead outweighs the matching speed.
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.dot_nl = bool(flags & re.DOTALL)
+        options.case_sensitive = not flags & re.IGNORECASE
+        try:
+            return re2.compile(pattern, options)
+        except re2.error as e:
+            logger.debug(f"RE2 rejected pattern, using stdlib re: {e}")
+    return re.compile(pattern, flags)
+
+# Literal anchors around the APP_INITIALIZATION_STATE assignment, located with str.find.
+# The bytes variants let the already-encoded document be searched and handed to orjson as-is.
+_APP_INIT_START = ';window.APP_INITIALIZATION_STATE'
+_APP_INIT_END = ';window.APP_FLAGS'
+_APP_INIT_ANCHORS = {
+    str: (_APP_INIT_START, '=', _APP_INIT_END, ('[', '{')),
+    bytes: (_APP_INIT_START.encode(), b'=', _APP_INIT_END.encode(), (b'[', b'{')),
+}
+_JSON_CLOSERS = {'[': ']', '{': '}', b'[': b']', b'{': b'}'}
+# The C scanner behind raw_decode doubles as a string/escape-aware bracket matcher
+_JSON_DECODER = json.JSONDecoder()
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_DIGIT_RE = re.compile(r'\d')
+_CATEGORY_SPLIT_RE = re.compile(r'[,·•]')
+
+class _DigitsOnlyTable(dict):
+    """str.translate table keeping decimal digits (same set as regex \\d) and deleting everything else."""
+    def __missing__(self, codepoint):
+        value = codepoint if chr(codepoint).isdecimal() else None
+        self[codepoint] = value
+        return value
+
+# Filled lazily per code point, so repeat lookups stay in C
+_DIGITS_ONLY = _DigitsOnlyTable()
+
+_UI_WORDS_RE = re.compile(r'\b(?:click|button|open|show|hide)\b', re.IGNORECASE)
+_IMAGE_URL_RE = re.compile(r'\.(?:jpe?g|png|webp)|googleusercontent', re.IGNORECASE)
+
+_NAME_PATTERNS = (
+    _compile_html(r'<title>([^-]+?)\s*-\s*Google Maps</title>'),  # STABLE - title tag
+    _compile_html(r'<h1[^>]*>.*?<span[^>]*>([^<]+)</span>'),  # STABLE - h1 without class dependency
+    _compile_html(r'<h1[^>]*class="[^"]*DUwDvf[^"]*"[^>]*>.*?<span[^>]*></span>([^<]+)<'),  # FRAGILE FALLBACK - obfuscated class
+)
+# The same title rule as _NAME_PATTERNS[0], applied to the title text from the parsed DOM
+_TITLE_NAME_RE = re.compile(r'\s*([^-]+?)\s*-\s*Google Maps')
+_PLACE_ID_RE = _compile_html(r'(ChIJ[a-zA-Z0-9_-]{20,})')
+_CID_RE = _compile_html(r'(0x[a-f0-9]+:0x[a-f0-9]+)')
+_LATITUDE_RE = _compile_html(r'\"latitude\"\s*:\s*([-]?\d+\.\d+)')
+_LONGITUDE_RE = _compile_html(r'\"longitude\"\s*:\s*([-]?\d+\.\d+)')
+
+_ADDRESS_ARIA_RE = _compile_html(r'aria-label="Address:\s*([^"]+)"')
+_ADDRESS_PATTERNS = (
+    _ADDRESS_ARIA_RE,  # HIGHLY STABLE - accessibility required
+    _compile_html(r'data-item-id="address"[^>]*aria-label="([^"]+)"'),  # STABLE - semantic + aria-label
+    _compile_html(r'button[^>]*data-item-id="address"[^>]*>([^<]+)<'),  # STABLE - semantic selector
+    _compile_html(r'"formatted_address"\s*:\s*"([^"]+)"'),  # MODERATE - JSON-like pattern
+    _compile_html(r'button[^>]*aria-label="[^"]*([0-9]+[^",]{15,80})"'),  # MODERATE - generic pattern
+)
+
+_RATING_ARIA_RE = _compile_html(r'aria-label="([\d.]+)\s+stars?"')  # HIGHLY STABLE - accessibility required
+_RATING_TEXT_RE = _compile_html(r'(\d\.\d)\s+out of 5 stars')  # MODERATE - alternative text pattern
+
+_REVIEWS_COUNT_PATTERNS = (
+    _compile_html(r'aria-label="[\d.]+\s+stars.*?([\d,]+)\s+reviews?"'),  # MODERATE - in aria-label
+    _compile_html(r'([\d,]+)\s+reviews?'),  # MODERATE - general pattern
+    _compile_html(r'([0-9,]+)\s*Google reviews?'),  # MODERATE - specific variant
+)
+
+_WEBSITE_ARIA_RE = _compile_html(r'aria-label="Website:\s*([^"]+)"')
+_WEBSITE_PATTERNS = (
+    _compile_html(r'data-item-id="authority"[^>]*href="([^"]+)"'),  # HIGHLY STABLE - semantic ID
+    _WEBSITE_ARIA_RE,  # HIGHLY STABLE - accessibility attribute
+    _compile_html(r'<a[^>]*aria-label="[^"]*[Ww]ebsite[^"]*"[^>]*href="([^"]+)"'),  # STABLE - aria-label variant
+    _compile_html(r'data-tooltip="Open website"[^>]*href="([^"]+)"'),  # MODERATE - data attribute
+)
+
+_PHONE_ARIA_RE = _compile_html(r'aria-label="Phone:\s*([^"]+)"')
+_PHONE_PATTERNS = (
+    _PHONE_ARIA_RE,  # HIGHLY STABLE - accessibility attribute
+    _compile_html(r'href="tel:([^"]+)"'),  # HIGHLY STABLE - standard tel: protocol
+    _compile_html(r'data-item-id="phone[^"]*"[^>]*aria-label="[^"]*([^"]+)"'),  # STABLE - semantic + aria
+    _compile_html(r'data-tooltip="Call"[^>]*href="tel:([^"]+)"'),  # MODERATE - data attribute
+    _compile_html(r'button[^>]*aria-label="[^"]*(\+?1?\s*\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})[^"]*"'),  # MODERATE - pattern in aria-label
+)
+
+# UI elements to exclude (not actual categories)
+_EXCLUDED_CATEGORY_TERMS = frozenset({
+    'save', 'share', 'send', 'directions', 'website', 'call', 'menu', 'order',
+    'reserve', 'learn more', 'show slider', 'photos', 'reviews', 'overview',
+    'about', 'updates', 'show', 'hide', 'more', 'less', 'see', 'view', 'edit',
+    'suggest', 'claim', 'add', 'report', 'nearby', 'similar', 'copy', 'close'
+})
+
+_CATEGORY_ARIA_RE = _compile_html(r'aria-label="Category:\s*([^"]+)"')
+_CATEGORY_PATTERNS = (
+    _CATEGORY_ARIA_RE,  # STABLE - accessibility attribute
+    _compile_html(r'data-item-id="category"[^>]*aria-label="([^"]+)"'),  # STABLE - semantic + aria
+    _compile_html(r'jsaction="pane\.[^"]*category[^>]*>([^<]+)</button>'),  # FRAGILE FALLBACK - obfuscated jsaction
+)
+
+_THUMBNAIL_PATTERNS = (
+    _compile_html(r'<meta\s+property="og:image"\s+content="([^"]+)"'),  # STABLE - Open Graph meta tag
+    _compile_html(r'<img[^>]*alt="[^"]*(?:Photo|Image)[^"]*"[^>]*src="([^"]+)"'),  # MODERATE - semantic alt text
+    _compile_html(r'<img[^>]*aria-label="[^"]*"[^>]*src="(https://[^"]+googleusercontent[^"]+)"'),  # MODERATE - Google image CDN
+    _compile_html(r'<img[^>]*src="(https://lh\d+\.googleusercontent\.com/[^"]+)"'),  # MODERATE - Google CDN pattern
+    _compile_html(r'jsaction="pane\.[^"]*[Hh]ero[^"]*[Ii]mage[^>]*<img[^>]+src="([^"]+)"'),  # FRAGILE FALLBACK - obfuscated jsaction
+    _compile_html(r'<img[^>]*class="[^"]*kSOdnb[^"]*"[^>]+src="([^"]+)"'),  # FRAGILE FALLBACK - obfuscated class
+)
+
+_DAY_HOURS_RE = _compile_html(r'aria-label="([A-Z][a-z]+day,\s+\d+(?::\d+)?\s+[AP]M\s+to\s+\d+(?::\d+)?\s+[AP]M)[^"]*"', re.IGNORECASE)  # Individual day hours
+_HOURS_ARIA_RE = _compile_html(r'aria-label="Hours:\s*([^"]+)"')
+_HOURS_PATTERNS = (
+    _HOURS_ARIA_RE,  # Hours in aria-label
+)
+
+# Single pass over every field-bearing aria-label. Each branch mirrors one of the
+# dedicated aria patterns above, so the matches collected per field are exactly what
+# that pattern would find on its own.
+_ARIA_FIELDS_RE = _compile_html(
+    r'aria-label="(?:'
+    r'(?P<rating>[\d.]+)\s+stars?'
+    r'|Address:\s*(?P<address>[^"]+)'
+    r'|Website:\s*(?P<website>[^"]+)'
+    r'|Phone:\s*(?P<phone>[^"]+)'
+    r'|Category:\s*(?P<category>[^"]+)'
+    r'|Hours:\s*(?P<hours>[^"]+)'
+    r'|(?P<day_hours>[A-Z][a-z]+day,\s+\d+(?::\d+)?\s+[AP]M\s+to\s+\d+(?::\d+)?\s+[AP]M)[^"]*'
+    r')"'
+)
+_ARIA_FIELD_BY_PATTERN = {
+    _RATING_ARIA_RE: 'rating',
+    _ADDRESS_ARIA_RE: 'address',
+    _WEBSITE_ARIA_RE: 'website',
+    _PHONE_ARIA_RE: 'phone',
+    _CATEGORY_ARIA_RE: 'category',
+    _HOURS_ARIA_RE: 'hours',
+    _DAY_HOURS_RE: 'day_hours',
+}
+
+# Star label on a results-feed card in any language that leads with the rating, e.g.
+# "4.5 stars 1,234 Reviews", "4,5 Sterne 1.234 Rezensionen", "4,5 étoiles 1 234 avis".
+# The rating takes either decimal mark; the count any thousands separator.
+_CARD_RATING_RE = re.compile(r'\s*(\d(?:[.,]\d+)?)(?:\s+\D+?\s*(\d{1,3}(?:[.,\u00a0\u202f ]\d{3})+|\d+))?')
+_CARD_DETAIL_SEPARATOR = '\u00b7'  # "Category · Address" rows; opening-hours rows use \u22c5 instead
+
+def _build_pattern_set(patterns):
+    """
+    Compiles full-document patterns into one RE2 set, which reports every pattern that
+    occurs anywhere in the HTML from a single DFA pass. Returns None without RE2.
+    """
+    if re2 is None or not patterns:
+        return None
+    options = re2.Options()
+    options.dot_nl = True
+    options.case_sensitive = False
+    pattern_set = re2.Set.SearchSet(options)
+    for pattern in patterns:
+        pattern_set.Add(pattern.pattern)
+    pattern_set.Compile()
+    return pattern_set
+
+# Every full-document fallback pattern compiled by RE2 with the default HTML flags.
+# A pattern the set reports as absent can be skipped without scanning the page again.
+_PREFILTERED_PATTERNS = tuple(
+    pattern
+    for pattern in (
+        *_NAME_PATTERNS, _PLACE_ID_RE, _CID_RE, _LATITUDE_RE, _LONGITUDE_RE,
+        *_ADDRESS_PATTERNS, _RATING_TEXT_RE, *_REVIEWS_COUNT_PATTERNS,
+        *_WEBSITE_PATTERNS, *_PHONE_PATTERNS, *_CATEGORY_PATTERNS,
+        *_THUMBNAIL_PATTERNS, *_HOURS_PATTERNS,
+    )
+    if not isinstance(pattern, re.Pattern) and pattern not in _ARIA_FIELD_BY_PATTERN
+)
+_PATTERN_SET = _build_pattern_set(_PREFILTERED_PATTERNS)
+
 def extract_initial_json(html_content):
     """
     Extracts the JSON string assigned to window.APP_INITIALIZATION_STATE from HTML content.
     Note: Google Maps has changed to load most data dynamically. This now extracts minimal metadata.
+    Accepts str or UTF-8 bytes and returns the same type.
     """
     try:
-        match = re.search(r';window\.APP_INITIALIZATION_STATE\s*=\s*(.*?);window\.APP_FLAGS', html_content, re.DOTALL)
-        if match:
-            json_str = match.group(1)
-            if json_str.strip().startswith(('[', '{')):
+        json_str = None
+        start_marker, equals_sign, end_marker, openers = _APP_INIT_ANCHORS[type(html_content)]
+        start = html_content.find(start_marker)
+        if start >= 0:
+            start += len(start_marker)
+            equals = html_content.find(equals_sign, start)
+            # Only whitespace may separate the variable name from the assignment
+            if equals >= 0 and not html_content[start:equals].strip():
+                end = html_content.find(end_marker, equals + 1)
+                if end >= 0:
+                    json_str = html_content[equals + 1:end].lstrip()
+        if json_str is not None:
+            if json_str.startswith(openers):
+                # The end marker can also appear inside a JSON string; then the slice
+                # stops short of the closing bracket and the value end is located by scanning
+                if not json_str.rstrip().endswith(_JSON_CLOSERS[json_str[:1]]):
+                    json_str = _slice_json_value(html_content, start)
                 return json_str
             else:
                 logger.warning("Extracted content doesn't look like valid JSON start.")
@@ -57,9 +293,54 @@ def extract_initial_json(html_content):
             logger.warning("APP_INITIALIZATION_STATE pattern not found.")
             return None
     except Exception as e:
-        logger.error(f"Error extracting JSON string: {e}")
+        logger.error("Error extracting JSON string: %s", e)
         return None
 
+def _slice_json_value(html_content, start):
+    """Returns the complete JSON value assigned after `start`, or None if it does not parse."""
+    is_bytes = isinstance(html_content, bytes)
+    if is_bytes:
+        html_content = html_content[start:].decode('utf-8', 'surrogatepass')
+        start = 0
+    equals = html_content.find('=', start) + 1
+    begin = len(html_content) - len(html_content[equals:].lstrip())
+    try:
+        _, end = _JSON_DECODER.raw_decode(html_content, begin)
+    except json.JSONDecodeError:
+        logger.warning("APP_INITIALIZATION_STATE value is not terminated by a closing bracket.")
+        return None
+    json_str = html_content[begin:end]
+    return json_str.encode('utf-8', 'surrogatepass') if is_bytes else json_str
+
+def loads_json(json_str):
+    """Decodes JSON with orjson when installed, otherwise with the stdlib decoder."""
+    if orjson is not None:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            # Stdlib json is more lenient (e.g. NaN/Infinity); let it make the final call
+            pass
+    return json.loads(json_str)
+
+def load_data_blob(json_str):
+    """
+    Returns the place blob at [5][3][2] of APP_INITIALIZATION_STATE.
+    With simdjson installed only that subtree is turned into Python objects;
+    a missing path raises TypeError, IndexError or KeyError like direct indexing.
+    """
+    if simdjson is not None:
+        try:
+            doc = simdjson.Parser().parse(json_str)
+        except ValueError:
+            # Not strict JSON (e.g. NaN); let the full decoders make the final call
+            pass
+        else:
+            if not isinstance(doc, (simdjson.Array, simdjson.Object)):
+                raise TypeError("APP_INITIALIZATION_STATE is not a container")
+            data_blob = doc.at_pointer('/5/3/2')
+            return data_blob.as_list() if isinstance(data_blob, simdjson.Array) else data_blob
+    return loads_json(json_str)[5][3][2]
+
 def parse_json_data(json_str):
     """
     Parses the extracted JSON string to get basic metadata.
@@ -69,112 +350,172 @@ def parse_json_data(json_str):
     if not json_str:
         return None
     try:
-        initial_data = json.loads(json_str)
-
-        # New structure: data is at [5][3][2] with sparse information
-        if isinstance(initial_data, list) and len(initial_data) > 5:
-            if isinstance(initial_data[5], list) and len(initial_data[5]) > 3:
-                if isinstance(initial_data[5][3], list) and len(initial_data[5][3]) > 2:
-                    data_blob = initial_data[5][3][2]
-                    if isinstance(data_blob, list) and len(data_blob) >= 19:
-                        # Extract minimal metadata from this sparse structure
-                        metadata = {
-                            'cid': data_blob[0] if len(data_blob) > 0 else None,  # Internal ID for reviews
-                            'name': data_blob[1] if len(data_blob) > 1 else None,
-                            'coordinates': None,
-                            'place_id': data_blob[18] if len(data_blob) > 18 else None,
-                        }
-
-                        # Extract coordinates from index 7
-                        if len(data_blob) > 7 and isinstance(data_blob[7], list) and len(data_blob[7]) >= 4:
-                            lat = data_blob[7][2]
-                            lon = data_blob[7][3]
-                            if lat is not None and lon is not None:
-                                metadata['coordinates'] = {"latitude": lat, "longitude": lon}
-
-                        logger.debug(f"Extracted metadata from APP_INITIALIZATION_STATE: {metadata.get('name')}")
-                        return metadata
-
-        logger.warning("Could not find expected data structure at [5][3][2]")
-        return None
+        # New structure: data is at [5][3][2] with sparse information.
+        # The layout is fixed, so index directly and treat a miss as "not found".
+        try:
+            data_blob = load_data_blob(json_str)
+            if type(data_blob) is not list:
+                raise TypeError("data blob is not a list")
+            # Extract minimal metadata from this sparse structure
+            metadata = {
+                'cid': data_blob[0],  # Internal ID for reviews
+                'name': data_blob[1],
+                'coordinates': None,
+                'place_id': data_blob[18],
+            }
+        except (TypeError, IndexError, KeyError):
+            logger.warning("Could not find expected data structure at [5][3][2]")
+            return None
+
+        # Extract coordinates from index 7
+        try:
+            lat, lon = data_blob[7][2], data_blob[7][3]
+            if lat is not None and lon is not None:
+                metadata['coordinates'] = {"latitude": lat, "longitude": lon}
+        except (TypeError, IndexError, KeyError):
+            pass
+
+        logger.debug("Extracted metadata from APP_INITIALIZATION_STATE: %s", metadata.get('name'))
+        return metadata
 
     except json.JSONDecodeError as e:
-        logger.error(f"Error decoding initial JSON: {e}")
+        logger.error("Error decoding initial JSON: %s", e)
         return None
     except Exception as e:
-        logger.error(f"Unexpected error parsing JSON data: {e}")
+        logger.error("Unexpected error parsing JSON data: %s", e)
         return None
 
 
 # --- Field Extraction Functions (Extract from HTML DOM, not JSON) ---
 
-def extract_from_html(html_content, pattern, group=1, default=None):
-    """Helper function to extract data from HTML using regex."""
-    try:
-        match = re.search(pattern, html_content, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(group)
-        return default
-    except Exception as e:
-        logger.debug(f"Error extracting with pattern: {e}")
-        return default
+def scan_aria_labels(html_content):
+    """
+    Collects the values of all field-bearing aria-labels in a single pass over the HTML.
+    Returns a dict mapping each field to its matches in document order.
+    """
+    aria = {field: [] for field in _ARIA_FIELD_BY_PATTERN.values()}
+    for match in _ARIA_FIELDS_RE.finditer(html_content):
+        field = match.lastgroup
+        aria[field].append(match.group(field))
+    return aria
+
+def scan_document(html_content):
+    """
+    Runs the single-pass scans over the HTML once so the get_* helpers can skip rescanning it.
+    Returns the aria-label buckets and the set of fallback patterns present in the document
+    (None when RE2 is unavailable and every pattern has to be searched).
+    """
+    present = None
+    if _PATTERN_SET is not None:
+        present = frozenset(_PREFILTERED_PATTERNS[i] for i in _PATTERN_SET.Match(html_content) or ())
+    return {'aria': scan_aria_labels(html_content), 'present': present}
+
+def _skip_pattern(pattern, scan):
+    """True when the document scan proved the pattern cannot match."""
+    present = scan['present']
+    return present is not None and pattern not in present and pattern in _PREFILTERED_PATTERNS
+
+def extract_from_html(html_content, pattern, group=1, default=None, scan=None):
+    """
+    Helper function to extract data from HTML using a precompiled regex.
+    Uses the document scan, when provided, to answer aria-label patterns and skip absent ones.
+    """
+    if scan is not None:
+        if pattern in _ARIA_FIELD_BY_PATTERN:
+            values = scan['aria'][_ARIA_FIELD_BY_PATTERN[pattern]]
+            return values[0] if values else default
+        if _skip_pattern(pattern, scan):
+            return default
+    match = pattern.search(html_content)
+    return match.group(group) if match else default
+
+def findall_from_html(html_content, pattern, scan=None):
+    """Helper function to find all matches in HTML, using the document scan when provided."""
+    if scan is not None:
+        if pattern in _ARIA_FIELD_BY_PATTERN:
+            return scan['aria'][_ARIA_FIELD_BY_PATTERN[pattern]]
+        if _skip_pattern(pattern, scan):
+            return []
+    return pattern.findall(html_content)
 
 def clean_html_text(text):
     """Remove HTML tags and clean up text."""
     if not text:
         return None
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    # Decode HTML entities
-    text = text.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"')
-    # Clean whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    # Most values (phone, rating, hours) carry no markup; skip the tag regex and entity decoding
+    if '<' in text or '&' in text:
+        # Remove HTML tags
+        text = _TAG_RE.sub('', text)
+        # Decode all named and numeric HTML entities in a single pass
+        text = unescape(text)
+    # Collapse and trim whitespace in one C-level split/join pass
+    text = ' '.join(text.split())
     return text if text else None
 
-def get_main_name(html_content, metadata):
+def parse_html_tree(html_content):
+    """Parses the HTML once into a DOM tree, or returns None if selectolax is unavailable."""
+    if LexborHTMLParser is None or not html_content:
+        return None
+    try:
+        return LexborHTMLParser(html_content)
+    except Exception as e:
+        logger.debug("Error parsing HTML tree: %s", e)
+        return None
+
+def extract_from_tree(tree, selector, attribute=None):
+    """Helper function to read an attribute (or text when attribute is None) from the first node matching a CSS selector."""
+    if tree is None:
+        return None
+    node = tree.css_first(selector)
+    if node is None:
+        return None
+    if attribute is None:
+        return node.text()
+    return node.attributes.get(attribute)
+
+def get_main_name(html_content, metadata, tree=None, scan=None):
     """Extracts the main name of the place from HTML or metadata."""
     # Try metadata first (from APP_INITIALIZATION_STATE)
     if metadata and metadata.get('name'):
         return metadata['name']
 
-    # STABLE: Try title tag first (most reliable)
-    name = extract_from_html(html_content, r'<title>([^-]+?)\s*-\s*Google Maps</title>', 1)
-    if name:
-        return clean_html_text(name)
-
-    # STABLE: Try h1 tag without class dependency
-    name = extract_from_html(html_content, r'<h1[^>]*>.*?<span[^>]*>([^<]+)</span>', 1)
-    if name:
-        return clean_html_text(name)
+    # STABLE: Title tag from the parsed DOM
+    title = extract_from_tree(tree, 'title')
+    match = _TITLE_NAME_RE.fullmatch(title) if title else None
+    if match:
+        name = clean_html_text(match.group(1))
+        if name:
+            return name
 
-    # FRAGILE FALLBACK: Only use as last resort (obfuscated class)
-    name = extract_from_html(html_content, r'<h1[^>]*class="[^"]*DUwDvf[^"]*"[^>]*>.*?<span[^>]*></span>([^<]+)<', 1)
-    if name:
-        return clean_html_text(name)
+    # STABLE: title tag first, then generic h1, obfuscated class as last resort
+    for pattern in _NAME_PATTERNS:
+        name = extract_from_html(html_content, pattern, 1, scan=scan)
+        if name:
+            return clean_html_text(name)
 
     return None
 
-def get_place_id(html_content, metadata):
+def get_place_id(html_content, metadata, scan=None):
     """Extracts the Google Place ID."""
     # Use metadata from APP_INITIALIZATION_STATE
     if metadata and metadata.get('place_id'):
         return metadata['place_id']
 
     # Fall back to searching HTML for ChIJ pattern
-    place_id = extract_from_html(html_content, r'(ChIJ[a-zA-Z0-9_-]{20,})', 1)
+    place_id = extract_from_html(html_content, _PLACE_ID_RE, 1, scan=scan)
     return place_id
 
-def get_place_id_cid(html_content, metadata):
+def get_place_id_cid(html_content, metadata, scan=None):
     """Extracts the internal Google Place ID (CID) for reviews URL."""
     # Use metadata from APP_INITIALIZATION_STATE
     if metadata and metadata.get('cid'):
         return metadata['cid']
 
     # Fall back to searching HTML
-    cid = extract_from_html(html_content, r'(0x[a-f0-9]+:0x[a-f0-9]+)', 1)
+    cid = extract_from_html(html_content, _CID_RE, 1, scan=scan)
     return cid
 
-def get_reviews_url(html_content, metadata):
+def get_reviews_url(html_content, metadata, scan=None):
     """
     Constructs the reviews URL using the internal Place ID (CID).
 
@@ -185,20 +526,20 @@ def get_reviews_url(html_content, metadata):
 
     Format: https://search.google.com/local/reviews?placeid={cid}
     """
-    cid = get_place_id_cid(html_content, metadata)
+    cid = get_place_id_cid(html_content, metadata, scan)
     if cid:
         return f"https://search.google.com/local/reviews?placeid={cid}"
     return None
 
-def get_gps_coordinates(html_content, metadata):
+def get_gps_coordinates(html_content, metadata, scan=None):
     """Extracts latitude and longitude."""
     # Use metadata from APP_INITIALIZATION_STATE
     if metadata and metadata.get('coordinates'):
         return metadata['coordinates']
 
     # Fall back to searching HTML for coordinate patterns
-    lat = extract_from_html(html_content, r'\"latitude\"\s*:\s*([-]?\d+\.\d+)', 1)
-    lon = extract_from_html(html_content, r'\"longitude\"\s*:\s*([-]?\d+\.\d+)', 1)
+    lat = extract_from_html(html_content, _LATITUDE_RE, 1, scan=scan)
+    lon = extract_from_html(html_content, _LONGITUDE_RE, 1, scan=scan)
 
     if lat and lon:
         try:
@@ -208,31 +549,32 @@ def get_gps_coordinates(html_content, metadata):
 
     return None
 
-def get_complete_address(html_content):
+def get_complete_address(html_content, tree=None, scan=None):
     """Extracts the complete address from HTML."""
-    # STABLE: Try semantic selectors first (accessibility attributes)
-    patterns = [
-        r'aria-label="Address:\s*([^"]+)"',  # HIGHLY STABLE - accessibility required
-        r'data-item-id="address"[^>]*aria-label="([^"]+)"',  # STABLE - semantic + aria-label
-        r'button[^>]*data-item-id="address"[^>]*>([^<]+)<',  # STABLE - semantic selector
-        r'"formatted_address"\s*:\s*"([^"]+)"',  # MODERATE - JSON-like pattern
-        r'button[^>]*aria-label="[^"]*([0-9]+[^",]{15,80})"',  # MODERATE - generic pattern
-    ]
+    # HIGHLY STABLE: Semantic ID + aria-label from the parsed DOM
+    address = extract_from_tree(tree, '[data-item-id="address"]', 'aria-label')
+    if address:
+        if address.startswith('Address:'):
+            address = address[len('Address:'):]
+        cleaned = clean_html_text(address)
+        if cleaned and len(cleaned) > 10 and _DIGIT_RE.search(cleaned):
+            return cleaned
 
-    for pattern in patterns:
-        address = extract_from_html(html_content, pattern, 1)
+    # STABLE: Try semantic selectors first (accessibility attributes)
+    for pattern in _ADDRESS_PATTERNS:
+        address = extract_from_html(html_content, pattern, 1, scan=scan)
         if address:
             cleaned = clean_html_text(address)
             # Validate it looks like an address (has some numbers and letters)
-            if cleaned and len(cleaned) > 10 and re.search(r'\d', cleaned):
+            if cleaned and len(cleaned) > 10 and _DIGIT_RE.search(cleaned):
                 return cleaned
 
     return None
 
-def get_rating(html_content):
+def get_rating(html_content, scan=None):
     """Extracts the average star rating from HTML."""
     # HIGHLY STABLE: aria-label with stars (accessibility required)
-    rating_str = extract_from_html(html_content, r'aria-label="([\d.]+)\s+stars?"', 1)
+    rating_str = extract_from_html(html_content, _RATING_ARIA_RE, 1, scan=scan)
     if rating_str:
         try:
             rating = float(rating_str)
@@ -242,7 +584,7 @@ def get_rating(html_content):
             pass
 
     # MODERATE: Try alternative text pattern
-    rating_str = extract_from_html(html_content, r'(\d\.\d)\s+out of 5 stars', 1)
+    rating_str = extract_from_html(html_content, _RATING_TEXT_RE, 1, scan=scan)
     if rating_str:
         try:
             return float(rating_str)
@@ -251,17 +593,11 @@ def get_rating(html_content):
 
     return None
 
-def get_reviews_count(html_content):
+def get_reviews_count(html_content, scan=None):
     """Extracts the total number of reviews from HTML."""
     # MODERATE STABILITY: Text patterns (format could change but unlikely)
-    patterns = [
-        r'aria-label="[\d.]+\s+stars.*?([\d,]+)\s+reviews?"',  # MODERATE - in aria-label
-        r'([\d,]+)\s+reviews?',  # MODERATE - general pattern
-        r'([0-9,]+)\s*Google reviews?',  # MODERATE - specific variant
-    ]
-
-    for pattern in patterns:
-        count_str = extract_from_html(html_content, pattern, 1)
+    for pattern in _REVIEWS_COUNT_PATTERNS:
+        count_str = extract_from_html(html_content, pattern, 1, scan=scan)
         if count_str:
             try:
                 # Remove commas and convert to int
@@ -274,18 +610,16 @@ def get_reviews_count(html_content):
 
     return None
 
-def get_website(html_content):
+def get_website(html_content, tree=None, scan=None):
     """Extracts the primary website link from HTML."""
-    # STABLE: Try semantic selectors first
-    patterns = [
-        r'data-item-id="authority"[^>]*href="([^"]+)"',  # HIGHLY STABLE - semantic ID
-        r'aria-label="Website:\s*([^"]+)"',  # HIGHLY STABLE - accessibility attribute
-        r'<a[^>]*aria-label="[^"]*[Ww]ebsite[^"]*"[^>]*href="([^"]+)"',  # STABLE - aria-label variant
-        r'data-tooltip="Open website"[^>]*href="([^"]+)"',  # MODERATE - data attribute
-    ]
+    # HIGHLY STABLE: Semantic ID from the parsed DOM
+    website = clean_html_text(extract_from_tree(tree, '[data-item-id="authority"]', 'href'))
+    if website and website.startswith('http'):
+        return website
 
-    for pattern in patterns:
-        website = extract_from_html(html_content, pattern, 1)
+    # STABLE: Try semantic selectors first
+    for pattern in _WEBSITE_PATTERNS:
+        website = extract_from_html(html_content, pattern, 1, scan=scan)
         if website:
             # Clean up the website URL
             website = clean_html_text(website)
@@ -297,120 +631,94 @@ def get_website(html_content):
 
     return None
 
-def get_phone_number(html_content):
+def get_phone_number(html_content, tree=None, scan=None):
     """Extracts and standardizes the primary phone number from HTML."""
-    # STABLE: Try semantic selectors first
-    patterns = [
-        r'aria-label="Phone:\s*([^"]+)"',  # HIGHLY STABLE - accessibility attribute
-        r'href="tel:([^"]+)"',  # HIGHLY STABLE - standard tel: protocol
-        r'data-item-id="phone[^"]*"[^>]*aria-label="[^"]*([^"]+)"',  # STABLE - semantic + aria
-        r'data-tooltip="Call"[^>]*href="tel:([^"]+)"',  # MODERATE - data attribute
-        r'button[^>]*aria-label="[^"]*(\+?1?\s*\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})[^"]*"',  # MODERATE - pattern in aria-label
-    ]
+    # HIGHLY STABLE: aria-label, then the tel: protocol, from the parsed DOM
+    phone = extract_from_tree(tree, '[aria-label^="Phone:"]', 'aria-label')
+    if not phone:
+        phone = extract_from_tree(tree, 'a[href^="tel:"]', 'href')
+    if phone:
+        standardized = phone.translate(_DIGITS_ONLY)
+        if len(standardized) >= 10:
+            return standardized
 
-    for pattern in patterns:
-        phone = extract_from_html(html_content, pattern, 1)
+    # STABLE: Try semantic selectors first
+    for pattern in _PHONE_PATTERNS:
+        phone = extract_from_html(html_content, pattern, 1, scan=scan)
         if phone:
             # Standardize phone number - remove all non-digits except leading +
             phone = clean_html_text(phone)
-            standardized = re.sub(r'\D', '', phone)
+            standardized = phone.translate(_DIGITS_ONLY)
             if len(standardized) >= 10:  # Valid phone should have at least 10 digits
                 return standardized
 
     return None
 
-def get_categories(html_content):
+def get_categories(html_content, scan=None):
     """Extracts the list of categories/types from HTML."""
-    # STABLE: Try semantic/aria-label patterns first
-    patterns = [
-        r'aria-label="Category:\s*([^"]+)"',  # STABLE - accessibility attribute
-        r'data-item-id="category"[^>]*aria-label="([^"]+)"',  # STABLE - semantic + aria
-        r'jsaction="pane\.[^"]*category[^>]*>([^<]+)</button>',  # FRAGILE FALLBACK - obfuscated jsaction
-    ]
-
-    all_categories = []
-
-    # UI elements to exclude (not actual categories)
-    excluded_terms = {
-        'save', 'share', 'send', 'directions', 'website', 'call', 'menu', 'order',
-        'reserve', 'learn more', 'show slider', 'photos', 'reviews', 'overview',
-        'about', 'updates', 'show', 'hide', 'more', 'less', 'see', 'view', 'edit',
-        'suggest', 'claim', 'add', 'report', 'nearby', 'similar', 'copy', 'close'
-    }
-
-    for pattern in patterns:
+    # STABLE: Try semantic/aria-label patterns first, stopping at the first pattern
+    # that yields categories (later patterns are less stable fallbacks)
+    for pattern in _CATEGORY_PATTERNS:
         # Use findall to get all matches
-        matches = re.findall(pattern, html_content, re.DOTALL | re.IGNORECASE)
+        matches = findall_from_html(html_content, pattern, scan)
+        if not matches:
+            continue
+
+        categories = []
+        seen = set()
         for match in matches:
             cleaned = clean_html_text(match)
             # Validate it looks like a category
             if cleaned and 2 < len(cleaned) < 50:
                 # Skip UI elements and common actions
-                if cleaned.lower() in excluded_terms:
+                if cleaned.lower() in _EXCLUDED_CATEGORY_TERMS:
                     continue
                 # Skip if it contains typical UI action words
-                if any(word in cleaned.lower() for word in ['click', 'button', 'open', 'show', 'hide']):
+                if _UI_WORDS_RE.search(cleaned):
                     continue
-                # Split by common separators
-                cats = [c.strip() for c in re.split(r'[,·•]', cleaned)]
-                for cat in cats:
-                    if cat and len(cat) > 2 and cat.lower() not in excluded_terms:
-                        all_categories.append(cat)
-
-    # Return unique categories
-    if all_categories:
-        unique_cats = []
-        seen = set()
-        for cat in all_categories:
-            cat_lower = cat.lower()
-            if cat_lower not in seen:
-                unique_cats.append(cat)
-                seen.add(cat_lower)
-        return unique_cats if unique_cats else None
+                # Split by common separators, keeping unique categories in order
+                for cat in _CATEGORY_SPLIT_RE.split(cleaned):
+                    cat = cat.strip()
+                    cat_lower = cat.lower()
+                    if len(cat) > 2 and cat_lower not in _EXCLUDED_CATEGORY_TERMS and cat_lower not in seen:
+                        seen.add(cat_lower)
+                        categories.append(cat)
+
+        if categories:
+            return categories
 
     return None
 
-def get_thumbnail(html_content):
+def get_thumbnail(html_content, tree=None, scan=None):
     """Extracts the main thumbnail image URL from HTML."""
-    # STABLE: Try semantic patterns first
-    patterns = [
-        r'<meta\s+property="og:image"\s+content="([^"]+)"',  # STABLE - Open Graph meta tag
-        r'<img[^>]*alt="[^"]*(?:Photo|Image)[^"]*"[^>]*src="([^"]+)"',  # MODERATE - semantic alt text
-        r'<img[^>]*aria-label="[^"]*"[^>]*src="(https://[^"]+googleusercontent[^"]+)"',  # MODERATE - Google image CDN
-        r'<img[^>]*src="(https://lh\d+\.googleusercontent\.com/[^"]+)"',  # MODERATE - Google CDN pattern
-        r'jsaction="pane\.[^"]*[Hh]ero[^"]*[Ii]mage[^>]*<img[^>]+src="([^"]+)"',  # FRAGILE FALLBACK - obfuscated jsaction
-        r'<img[^>]*class="[^"]*kSOdnb[^"]*"[^>]+src="([^"]+)"',  # FRAGILE FALLBACK - obfuscated class
-    ]
+    # STABLE: Open Graph meta tag from the parsed DOM
+    thumbnail = extract_from_tree(tree, 'meta[property="og:image"]', 'content')
+    if thumbnail and thumbnail.startswith(('http://', 'https://')):
+        if _IMAGE_URL_RE.search(thumbnail):
+            return thumbnail
 
-    for pattern in patterns:
-        thumbnail = extract_from_html(html_content, pattern, 1)
+    # STABLE: Try semantic patterns first
+    for pattern in _THUMBNAIL_PATTERNS:
+        thumbnail = extract_from_html(html_content, pattern, 1, scan=scan)
         if thumbnail and ('http://' in thumbnail or 'https://' in thumbnail):
             # Validate it's an actual image URL
-            if any(ext in thumbnail.lower() for ext in ['.jpg', '.jpeg', '.png', '.webp', 'googleusercontent']):
+            if _IMAGE_URL_RE.search(thumbnail):
                 return thumbnail
 
     return None
 
-def get_hours(html_content):
+def get_hours(html_content, scan=None):
     """Extracts business hours from HTML."""
     # HIGHLY STABLE: aria-labels contain hour information
-    patterns = [
-        r'aria-label="([A-Z][a-z]+day,\s+\d+(?::\d+)?\s+[AP]M\s+to\s+\d+(?::\d+)?\s+[AP]M)[^"]*"',  # Individual day hours
-        r'aria-label="Hours:\s*([^"]+)"',  # Hours in aria-label
-        r'aria-label="Show open hours[^"]*"',  # Marker that hours exist
-    ]
-
-    hours_list = []
-
     # Try to extract all day hours
-    day_hours = re.findall(patterns[0], html_content, re.IGNORECASE)
+    day_hours = findall_from_html(html_content, _DAY_HOURS_RE, scan)
     if day_hours:
         # Return as a list of day-hour strings
         return day_hours
 
     # Try general hours pattern
-    for pattern in patterns[1:]:
-        hours = extract_from_html(html_content, pattern, 1)
+    for pattern in _HOURS_PATTERNS:
+        hours = extract_from_html(html_content, pattern, 1, scan=scan)
         if hours:
             cleaned = clean_html_text(hours)
             if cleaned and len(cleaned) > 5:
@@ -418,13 +726,80 @@ def get_hours(html_content):
 
     return None
 
-def extract_place_data(html_content):
+def get_card_category(lines, name):
+    """
+    Finds the category on a results-feed card: the leading part of the first "Category · Address" row
+    whose lead looks like one (letters, no digits, not a UI label). Rows without the separator (labels
+    such as "Sponsored", price levels, buttons) and opening-hours rows are skipped.
+    """
+    for line in lines:
+        if _CARD_DETAIL_SEPARATOR not in line or '\u22c5' in line:
+            continue
+        category = line.split(_CARD_DETAIL_SEPARATOR, 1)[0].strip()
+        if not 2 < len(category) < 50 or category == name:
+            continue
+        if _DIGIT_RE.search(category) or not any(char.isalpha() for char in category):
+            continue
+        if category.lower() in _EXCLUDED_CATEGORY_TERMS or _UI_WORDS_RE.search(category):
+            continue
+        return category
+    return None
+
+def parse_feed_card(card):
+    """
+    Builds a place dict from a results-feed card read off the search page ({link, name, rating_label, text}).
+    Cards only carry the name, rating, reviews count and category, so those (plus the link) are the only fields set.
+    """
+    name = clean_html_text(card.get('name'))
+    if not name:
+        return None
+    place_details = {'name': name}
+    match = _CARD_RATING_RE.match(card.get('rating_label') or '')
+    if match:
+        rating = float(match.group(1).replace(',', '.'))
+        if 1.0 <= rating <= 5.0:
+            place_details['rating'] = rating
+        if match.group(2):
+            place_details['reviews_count'] = int(match.group(2).translate(_DIGITS_ONLY))
+    lines = [line.strip() for line in (card.get('text') or '').splitlines()]
+    category = get_card_category([line for line in lines if line], name)
+    if category:
+        place_details['categories'] = [category]
+    place_details['link'] = card['link']
+    return place_details
+
+def extract_place_data(html_content, include_deprecated=False):
     """
     High-level function to orchestrate extraction from HTML content.
     Updated to extract from rendered HTML DOM instead of JSON (Google Maps changed structure).
+    Results are cached by HTML digest; each call returns its own deep copy, so callers
+    may modify the result (including its lists and coordinates dict) without touching the cache.
+    Deprecated fields (reviews_url) are only extracted when include_deprecated is True.
+    """
+    html_bytes = html_content.encode('utf-8', 'surrogatepass')
+    digest = (hashlib.blake2b(html_bytes, digest_size=16).digest(), include_deprecated)
+    with _result_cache_lock:
+        if digest in _result_cache:
+            _result_cache.move_to_end(digest)
+            cached = _result_cache[digest]
+            logger.debug("Returning cached extraction result for identical HTML")
+            return copy.deepcopy(cached)
+
+    place_details = _extract_place_data_uncached(html_content, include_deprecated, html_bytes)
+
+    with _result_cache_lock:
+        _result_cache[digest] = place_details
+        if len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+    return copy.deepcopy(place_details)
+
+def _extract_place_data_uncached(html_content, include_deprecated=False, html_bytes=None):
+    """
+    Runs the full extraction pipeline for one HTML document.
+    When the UTF-8 encoding is supplied, the JSON blob is located and decoded from it directly.
     """
     # Extract minimal metadata from APP_INITIALIZATION_STATE JSON (place_id, coordinates, CID)
-    json_str = extract_initial_json(html_content)
+    json_str = extract_initial_json(html_bytes if html_bytes is not None else html_content)
     metadata = None
     if json_str:
         metadata = parse_json_data(json_str)
@@ -433,31 +808,41 @@ def extract_place_data(html_content):
     else:
         logger.debug("APP_INITIALIZATION_STATE not found in HTML")
 
-    # Extract all fields from HTML DOM (primary method) and metadata (fallback)
-    place_details = {
-        "name": get_main_name(html_content, metadata),
-        "place_id": get_place_id(html_content, metadata),
-        "coordinates": get_gps_coordinates(html_content, metadata),
-        "address": get_complete_address(html_content),
-        "rating": get_rating(html_content),
-        "reviews_count": get_reviews_count(html_content),
-        "reviews_url": get_reviews_url(html_content, metadata),
-        "categories": get_categories(html_content),
-        "website": get_website(html_content),
-        "phone": get_phone_number(html_content),
-        "thumbnail": get_thumbnail(html_content),
-        "hours": get_hours(html_content),
+    # Parse the document once; DOM lookups fall back to regex scans when they miss
+    tree = parse_html_tree(html_content)
+    # Walk every aria-label once and find which fallback patterns occur at all
+    scan = scan_document(html_content)
+
+    # Extract all fields from HTML DOM (primary method) and metadata (fallback).
+    # Each entry is (field, extractor, extra args after html_content).
+    fields = (
+        ("name", get_main_name, (metadata, tree, scan)),
+        ("place_id", get_place_id, (metadata, scan)),
+        ("coordinates", get_gps_coordinates, (metadata, scan)),
+        ("address", get_complete_address, (tree, scan)),
+        ("rating", get_rating, (scan,)),
+        ("reviews_count", get_reviews_count, (scan,)),
+        ("categories", get_categories, (scan,)),
+        ("website", get_website, (tree, scan)),
+        ("phone", get_phone_number, (tree, scan)),
+        ("thumbnail", get_thumbnail, (tree, scan)),
+        ("hours", get_hours, (scan,)),
         # Add other fields as needed
-    }
-
-    # Filter out None values
-    place_details = {k: v for k, v in place_details.items() if v is not None}
+    )
+    if include_deprecated:
+        fields += (("reviews_url", get_reviews_url, (metadata, scan)),)
+    # Keep only the fields that were found, in one pass
+    place_details = {}
+    for field, extractor, args in fields:
+        value = extractor(html_content, *args)
+        if value is not None:
+            place_details[field] = value
 
     if not place_details or not place_details.get('name'):
         logger.warning("Failed to extract sufficient place data from HTML")
         return None
 
-    logger.info(f"Successfully extracted data for: {place_details.get('name')}")
+    logger.info("Successfully extracted data for: %s", place_details.get('name'))
     return place_details
 
 # Example usage (for testing):
@@ -1,11 +1,16 @@
 from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response
 from typing import Optional, List, Dict, Any
 import logging
 import asyncio
+import orjson
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 
 # Import the scraper function (adjust path if necessary)
 try:
-    from gmaps_scraper_server.scraper import scrape_google_maps
+    from gmaps_scraper_server.scraper import scrape_google_maps, close_browsers
 except ImportError:
     # Handle case where scraper might be in a different structure later
     logging.error("Could not import scrape_google_maps from scraper.py")
@@ -13,44 +18,95 @@ except ImportError:
     def scrape_google_maps(*args, **kwargs):
         raise ImportError("Scraper function not available.")
 
-# Configure basic logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    async def close_browsers():
+        pass
+
+@asynccontextmanager
+async def lifespan(app):
+    """Configures logging when the server starts and closes the scraper's shared browser when it shuts down."""
+    # Configured at startup rather than import, so importing this module leaves the host's logging alone
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    yield
+    await close_browsers()
 
 app = FastAPI(
     title="Google Maps Scraper API",
     description="API to trigger Google Maps scraping based on a query.",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+# --- Result Cache ---
+# Repeat queries within the TTL are answered without launching a browser.
+# Keyed on the inputs that change the results; headless/concurrency only affect how they are fetched.
+SCRAPE_CACHE_TTL = 300  # seconds
+SCRAPE_CACHE_SIZE = 512
+_scrape_cache = OrderedDict()
+
+async def cached_scrape(query, max_places, lang, headless, concurrency, details=True):
+    """
+    Runs scrape_google_maps, reusing results for the same (query, max_places, lang, details) within SCRAPE_CACHE_TTL.
+    Empty results are not cached, since the scraper also returns [] when it fails.
+    """
+    key = (query, max_places, lang, details)
+    entry = _scrape_cache.get(key)
+    if entry is not None:
+        cached_at, results = entry
+        if time.monotonic() - cached_at < SCRAPE_CACHE_TTL:
+            _scrape_cache.move_to_end(key)
+            logging.info("Returning cached results for query: '%s'", query)
+            return results
+        del _scrape_cache[key]
+
+    results = await scrape_google_maps(
+        query=query,
+        max_places=max_places,
+        lang=lang,
+        headless=headless,
+        concurrency=concurrency,
+        details=details
+    )
+    if results:
+        _scrape_cache[key] = (time.monotonic(), results)
+        if len(_scrape_cache) > SCRAPE_CACHE_SIZE:
+            _scrape_cache.popitem(last=False)
+    return results
+
 @app.post("/scrape", response_model=List[Dict[str, Any]])
 async def run_scrape(
-    query: str = Query(..., description="The search query for Google Maps (e.g., 'restaurants in New York')"),
-    max_places: Optional[int] = Query(None, description="Maximum number of places to scrape. Scrapes all found if None."),
+    query: str = Query(..., min_length=1, pattern=r"^\s*\S", description="The search query for Google Maps (e.g., 'restaurants in New York')"),
+    max_places: Optional[int] = Query(None, ge=1, description="Maximum number of places to scrape. Scrapes all found if None."),
     lang: str = Query("en", description="Language code for Google Maps results (e.g., 'en', 'es')."),
     headless: bool = Query(True, description="Run the browser in headless mode (no UI). Set to false for debugging locally."),
-    concurrency: int = Query(5, description="Number of concurrent tabs for scraping details. Default is 5.")
+    concurrency: int = Query(5, ge=1, description="Number of concurrent tabs for scraping details. Default is 5."),
+    details: bool = Query(True, description="Open every place page for full details. Set to false to return only name, rating, reviews count, categories and link from the result list (much faster).")
 ):
     """
     Triggers the Google Maps scraping process for the given query.
+    The results are returned as an ORJSONResponse, which bypasses response_model validation
+    (the model is kept for the OpenAPI schema only).
     """
-    logging.info(f"Received scrape request for query: '{query}', max_places: {max_places}, lang: {lang}, "
-                 f"headless: {headless}, concurrency: {concurrency}")
+    # Bounds are enforced by the Query declarations, so only valid requests reach this log
+    logging.info("Received scrape request for query: '%s', max_places: %s, lang: %s, "
+                 "headless: %s, concurrency: %s, details: %s", query, max_places, lang, headless, concurrency, details)
     try:
         # Run the potentially long-running scraping task with timeout
         # Note: For production, consider running this in a background task queue (e.g., Celery)
         # to avoid blocking the API server for long durations.
         results = await asyncio.wait_for(
-            scrape_google_maps(
+            cached_scrape(
                 query=query,
                 max_places=max_places,
                 lang=lang,
                 headless=headless,
-                concurrency=concurrency
+                concurrency=concurrency,
+                details=details
             ),
             timeout=300  # 5 minutes timeout
         )
-        logging.info(f"Scraping finished for query: '{query}'. Found {len(results)} results.")
-        return results
+        logging.info("Scraping finished for query: '%s'. Found %d results.", query, len(results))
+        return ORJSONResponse(results)
     except asyncio.TimeoutError:
         logging.error(f"Scraping timeout for query '{query}' after 300 seconds")
         raise HTTPException(status_code=504, detail="Scraping request timed out after 5 minutes")
@@ -64,33 +120,37 @@ async def run_scrape(
 
 @app.get("/scrape-get", response_model=List[Dict[str, Any]])
 async def run_scrape_get(
-    query: str = Query(..., description="The search query for Google Maps (e.g., 'restaurants in New York')"),
-    max_places: Optional[int] = Query(None, description="Maximum number of places to scrape. Scrapes all found if None."),
+    query: str = Query(..., min_length=1, pattern=r"^\s*\S", description="The search query for Google Maps (e.g., 'restaurants in New York')"),
+    max_places: Optional[int] = Query(None, ge=1, description="Maximum number of places to scrape. Scrapes all found if None."),
     lang: str = Query("en", description="Language code for Google Maps results (e.g., 'en', 'es')."),
     headless: bool = Query(True, description="Run the browser in headless mode (no UI). Set to false for debugging locally."),
-    concurrency: int = Query(5, description="Number of concurrent tabs for scraping details. Default is 5.")
+    concurrency: int = Query(5, ge=1, description="Number of concurrent tabs for scraping details. Default is 5."),
+    details: bool = Query(True, description="Open every place page for full details. Set to false to return only name, rating, reviews count, categories and link from the result list (much faster).")
 ):
     """
     Triggers the Google Maps scraping process for the given query via GET request.
+    Results are returned as an ORJSONResponse, like the POST endpoint.
     """
-    logging.info(f"Received GET scrape request for query: '{query}', max_places: {max_places}, lang: {lang}, "
-                 f"headless: {headless}, concurrency: {concurrency}")
+    # Bounds are enforced by the Query declarations, so only valid requests reach this log
+    logging.info("Received GET scrape request for query: '%s', max_places: %s, lang: %s, "
+                 "headless: %s, concurrency: %s, details: %s", query, max_places, lang, headless, concurrency, details)
     try:
         # Run the potentially long-running scraping task with timeout
         # Note: For production, consider running this in a background task queue (e.g., Celery)
         # to avoid blocking the API server for long durations.
         results = await asyncio.wait_for(
-            scrape_google_maps(
+            cached_scrape(
                 query=query,
                 max_places=max_places,
                 lang=lang,
                 headless=headless,
-                concurrency=concurrency
+                concurrency=concurrency,
+                details=details
             ),
             timeout=300  # 5 minutes timeout
         )
-        logging.info(f"Scraping finished for query: '{query}'. Found {len(results)} results.")
-        return results
+        logging.info("Scraping finished for query: '%s'. Found %d results.", query, len(results))
+        return ORJSONResponse(results)
     except asyncio.TimeoutError:
         logging.error(f"Scraping timeout for query '{query}' after 300 seconds")
         raise HTTPException(status_code=504, detail="Scraping request timed out after 5 minutes")
@@ -103,12 +163,15 @@ async def run_scrape_get(
         raise HTTPException(status_code=500, detail=f"An internal error occurred during scraping: {str(e)}")
 
 
-# Basic root endpoint for health check or info
+# Basic root endpoint for health check or info.
+# The body never changes, so it is serialized once at import.
+_ROOT_BYTES = orjson.dumps({"message": "Google Maps Scraper API is running."})
+
 @app.get("/")
 async def read_root():
-    return {"message": "Google Maps Scraper API is running."}
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 # Example for running locally (uvicorn main_api:app --reload)
 # if __name__ == "__main__":
 #     import uvicorn
-#     uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+#     uvicorn.run(app, host="0.0.0.0", port=8001, loop="uvloop", http="httptools")
\ No newline at end of file
@@ -2,22 +2,53 @@ import json
 import asyncio
 import re
 import random
+import itertools
 import logging
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 from urllib.parse import urlencode
 
+try:
+    import diskcache
+except ImportError:  # Optional: place pages are always fetched
+    diskcache = None
+
 # Import the extraction functions from our helper module
 from . import extractor
 
 # --- Logging Configuration ---
 logger = logging.getLogger(__name__)
 
+def _env_int(name, default):
+    """Reads an integer setting from the environment, falling back to the default if unset or malformed."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}; using {default}")
+        return default
+
 # --- Constants ---
 BASE_URL = "https://www.google.com/maps/search/"
 DEFAULT_TIMEOUT = 30000  # 30 seconds for navigation and selectors
-SCROLL_PAUSE_TIME = 1.5  # Pause between scrolls
-MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS = 5 # Stop scrolling if no new links found after this many scrolls
+MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS = 2 # Stop scrolling if no new links found after this many scrolls (each waits out FEED_GROWTH_TIMEOUT)
+FEED_TIMEOUT = 15000  # Max wait (ms) for the results feed; overlaps the consent handling
+FEED_GROWTH_TIMEOUT = 3000  # Max wait (ms) for the feed to load more results after a scroll
+PLACE_READY_SELECTOR = 'h1'  # Place name heading: the extractable DOM has arrived
+PLACE_READY_TIMEOUT = 10000  # Max wait (ms) for it after navigation commits
+PLACE_DETAILS_SELECTOR = '[role="main"] [aria-label*="star"]'  # Rating stars: the late-rendering details are in
+PLACE_DETAILS_TIMEOUT = 2500  # Max wait (ms) for them; places without a rating use it up
+PLACE_SCRAPE_TIMEOUT = 60  # Hard cap (seconds) on one place, so a hung page cannot stall its worker
+
+# On-disk cache of extracted place data, keyed by canonical place link
+PLACE_CACHE_DIR = os.environ.get('PLACE_CACHE_DIR', '.gmaps_cache')
+PLACE_CACHE_TTL = _env_int('PLACE_CACHE_TTL', 7 * 24 * 3600)  # seconds; 0 disables the cache
+PLACE_CACHE_SIZE_LIMIT = 1_000_000_000  # bytes
 
 # User agent rotation for anti-detection
 USER_AGENTS = [
@@ -26,11 +57,283 @@ USER_AGENTS = [
     'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
 ]
 
+# Consent dialog buttons, including Spanish and input elements (from PR #7)
+CONSENT_XPATH = "//button[.//span[contains(text(), 'Accept all') or contains(text(), 'Reject all') or contains(text(), 'Aceptar todo') or contains(text(), 'Rechazar todo') or contains(text(), 'Accept')]] | //input[@type='submit' and (@value='Accept all' or @value='Reject all' or @value='Aceptar todo' or @value='Rechazar todo')]"
+# Preferred consent choice: "Accept all" / "Aceptar todo"
+ACCEPT_CONSENT_XPATH = "//button[.//span[contains(text(), 'Accept all') or contains(text(), 'Aceptar todo')]] | //input[@type='submit' and (@value='Accept all' or @value='Aceptar todo')]"
+# "End of results" marker in multiple languages (PR #7)
+END_MARKER_XPATH = "//span[contains(text(), \"You've reached the end of the list.\") or contains(text(), \"Has llegado al final de la lista\")]"
+
+# Requests the extractor never reads; aborting them cuts most of a Maps page's bytes.
+# Stylesheets stay allowed on the search page: the feed only scrolls (and loads more
+# results) when styled as a scroll container. Place pages are read, never scrolled,
+# so their detail pages also drop stylesheets.
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+BLOCKED_URL_MARKERS = ('googleusercontent', '/vt/')  # Photos and map tiles
+BLOCKED_DETAIL_RESOURCE_TYPES = frozenset({'stylesheet'})
+
+# Feature id of the place in a link's data= segment, shared by every URL variant of that place
+PLACE_FEATURE_ID_RE = re.compile(r'!1s([^!?/]+)')
+
+# Search box variants, combined so a single wait matches whichever one the page renders
+SEARCH_BOX_SELECTOR = ', '.join((
+    'input[id="searchboxinput"]',
+    'input[aria-label*="Search"]',
+    'input[placeholder*="Search"]',
+    'input[name="q"]',
+))
+SEARCH_BOX_TIMEOUT = 10000  # Max wait (ms) for it on the homepage
+
+# Every place link on the page, collected in one evaluate (no locator handle)
+PLACE_LINKS_JS = """() => Array.from(document.querySelectorAll('a[href*="/maps/place/"]'), a => a.href)"""
+
+# What a results card shows, for every card in the feed: the card's link carries the place name
+# as its aria-label, its star image (the role=img label that leads with a number, in any
+# language) the rating and reviews count, and its rendered text the category row
+FEED_CARDS_JS = """(selector) => Array.from(
+    document.querySelectorAll(selector + ' a[href*="/maps/place/"]'),
+    a => {
+        const card = a.parentElement;
+        const stars = card && Array.from(card.querySelectorAll('[role="img"][aria-label]'))
+            .find(img => /^\\s*\\d/.test(img.getAttribute('aria-label')));
+        return {
+            link: a.href,
+            name: a.getAttribute('aria-label'),
+            rating_label: stars ? stars.getAttribute('aria-label') : null,
+            text: card ? card.innerText : '',
+        };
+    })"""
+
+# Scrolls the results feed entirely inside the page and resolves with the place links found,
+# so the whole scroll phase is a single evaluate. Mirrors the former Python loop: after each
+# scroll it waits up to growthTimeout ms for the feed to grow (plus a small random jitter),
+# and stops at max_places, at the end-of-list marker, or after maxStalls scrolls with neither
+# new height nor new links. Links are keyed like canonical_place_key (feature id, else path).
+AUTO_SCROLL_JS = """async ({selector, maxPlaces, maxStalls, growthTimeout, endMarkerXPath}) => {
+    const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+    const links = new Map();
+    let lastHeight = null;
+    let stalls = 0;
+    let reason = 'stalled';
+    while (true) {
+        const feed = document.querySelector(selector);
+        if (!feed) { reason = 'missing'; break; }
+        let added = false;
+        for (const a of feed.querySelectorAll('a[href*="/maps/place/"]')) {
+            const id = a.href.match(/!1s([^!?\/]+)/);
+            const key = id ? id[1] : a.href.split('?')[0];
+            if (!links.has(key)) { links.set(key, a.href); added = true; }
+        }
+        if (maxPlaces !== null && links.size >= maxPlaces) { reason = 'max_places'; break; }
+        const height = feed.scrollHeight;
+        if (height === lastHeight) {
+            const endMarker = document.evaluate(
+                endMarkerXPath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            if (endMarker !== null) { reason = 'end'; break; }
+            if (added) {
+                stalls = 0;
+            } else if (++stalls >= maxStalls) {
+                break;
+            }
+        } else {
+            lastHeight = height;
+            stalls = 0;
+        }
+        feed.scrollTop = height;
+        const deadline = Date.now() + growthTimeout;
+        while (Date.now() < deadline && feed.isConnected && feed.scrollHeight <= height) {
+            await sleep(100);
+        }
+        await sleep(100 + Math.random() * 200);
+    }
+    return {links: Array.from(links.values()), reason};
+}"""
+
+# Waits (up to timeout ms) for the place details to render, then serializes the page
+# without the parts the extractor never reads, all in one evaluate. Stylesheets and SVG
+# path data (icons, map tiles) make up most of page.content() and all cross CDP.
+# Works on a detached clone so the live page is untouched.
+PLACE_HTML_JS = """async ({detailsSelector, timeout}) => {
+    const deadline = Date.now() + timeout;
+    let ready = document.querySelector(detailsSelector) !== null;
+    while (!ready && Date.now() < deadline) {
+        await new Promise(resolve => setTimeout(resolve, 50));
+        ready = document.querySelector(detailsSelector) !== null;
+    }
+    const root = document.documentElement.cloneNode(true);
+    for (const node of root.querySelectorAll('style, link[rel="stylesheet"]')) node.remove();
+    for (const svg of root.querySelectorAll('svg')) svg.replaceChildren();
+    return {html: root.outerHTML, ready};
+}"""
+
 def random_delay(min_sec=1.0, max_sec=2.0):
     """Returns random delay for anti-detection"""
     return random.uniform(min_sec, max_sec)
 
+# --- Extraction Workers ---
+def _available_cpus():
+    """Counts the CPUs this process may run on (honours cpuset pinning, unlike os.cpu_count)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+# HTML extraction is CPU-bound; with more than one CPU it runs in worker processes
+EXTRACTION_WORKERS = _available_cpus()
+_extraction_pool = None
+
+def get_extraction_pool():
+    """Returns the shared extraction process pool, or None when only one CPU is available."""
+    global _extraction_pool
+    if _extraction_pool is None and EXTRACTION_WORKERS > 1:
+        # spawn, not fork: the parent holds Playwright's threads and pipes
+        _extraction_pool = ProcessPoolExecutor(
+            max_workers=EXTRACTION_WORKERS,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+    return _extraction_pool
+
+async def extract_place_data(html_content):
+    """Runs extractor.extract_place_data in the process pool if there is one, otherwise in a thread."""
+    pool = get_extraction_pool()
+    if pool is None:
+        # Keeps the event loop switching to page events while a large page is parsed
+        return await asyncio.to_thread(extractor.extract_place_data, html_content)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, extractor.extract_place_data, html_content)
+    except BrokenProcessPool:
+        # A worker died and the executor is unusable from now on: replace it and retry once
+        logger.warning("Extraction worker crashed; restarting the process pool")
+        shutdown_extraction_pool(pool)
+    try:
+        return await loop.run_in_executor(get_extraction_pool(), extractor.extract_place_data, html_content)
+    except BrokenProcessPool:
+        # Crashed again on the same page; skip it, leaving a fresh pool for the next one
+        logger.error("Extraction worker crashed twice on the same page; skipping it")
+        shutdown_extraction_pool()
+        return None
+
+def shutdown_extraction_pool(pool=None, wait=False):
+    """
+    Shuts down the extraction process pool so the next extraction starts a new one.
+    With pool given, only if that is still the current pool (another worker may have replaced it already).
+    """
+    global _extraction_pool
+    if _extraction_pool is not None and (pool is None or _extraction_pool is pool):
+        _extraction_pool.shutdown(wait=wait, cancel_futures=True)
+        _extraction_pool = None
+
+# --- Shared Browser ---
+# Launching Chromium dominates small queries, so the browsers for each headless mode are
+# kept for the life of the process and every scrape opens its own context in one of them.
+# With BROWSER_POOL_SIZE > 1, concurrent scrapes are spread over up to that many browsers
+# (useful only with a CPU per browser; the default single browser suits a pinned container).
+BROWSER_POOL_SIZE = max(1, _env_int('BROWSER_POOL_SIZE', 1))
+BROWSER_ARGS = [
+    '--disable-dev-shm-usage',  # Use /tmp instead of /dev/shm for shared memory
+    '--no-sandbox',  # Required for running in Docker
+    '--disable-setuid-sandbox',
+]
+_playwright = None
+_browsers = {}  # headless -> list of launched browsers
+_browser_lock = asyncio.Lock()
+
+async def new_browser_context(headless=True, **context_options):
+    """
+    Opens a scrape context in a shared Chromium browser for this headless mode: the one running the
+    fewest contexts, launching another while that one is busy and the pool has room.
+    The context is created under the lock, so a burst of concurrent searches sees each other's
+    contexts and spreads over the pool instead of all picking the same idle browser.
+    """
+    global _playwright
+    async with _browser_lock:
+        pool = [browser for browser in _browsers.get(headless, ()) if browser.is_connected()]
+        _browsers[headless] = pool
+        browser = min(pool, key=lambda b: len(b.contexts), default=None)
+        if browser is None or (browser.contexts and len(pool) < BROWSER_POOL_SIZE):
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            logger.info(f"Launching shared browser {len(pool) + 1}/{BROWSER_POOL_SIZE} (headless={headless})...")
+            browser = await _playwright.chromium.launch(headless=headless, args=BROWSER_ARGS)
+            pool.append(browser)
+        return await browser.new_context(**context_options)
+
+async def close_browsers():
+    """Closes the shared browsers, stops Playwright and shuts down the extraction workers. Call on application shutdown."""
+    global _playwright
+    async with _browser_lock:
+        for pool in _browsers.values():
+            for browser in pool:
+                if browser.is_connected():
+                    await browser.close()
+        _browsers.clear()
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+    shutdown_extraction_pool(wait=True)
+
+# --- Place Cache ---
+# Reads and writes are SQLite calls that can block (up to diskcache's lock timeout),
+# so they run in a thread; any cache failure degrades to scraping without the cache.
+_place_cache = None
+_place_cache_failed = False
+
+def get_place_cache():
+    """
+    Returns the on-disk place cache, opening it on first use.
+    None if disabled, diskcache is missing, or PLACE_CACHE_DIR cannot be opened.
+    """
+    global _place_cache, _place_cache_failed
+    if _place_cache is None and not _place_cache_failed and diskcache is not None and PLACE_CACHE_TTL > 0:
+        try:
+            _place_cache = diskcache.Cache(PLACE_CACHE_DIR, size_limit=PLACE_CACHE_SIZE_LIMIT)
+        except Exception as e:
+            _place_cache_failed = True
+            logger.warning(f"Place cache unavailable at {PLACE_CACHE_DIR!r}, continuing without it: {e}")
+    return _place_cache
+
+async def get_cached_place(place_cache, cache_key):
+    """Looks a place up in the cache off the event loop; a failed read counts as a miss."""
+    try:
+        return await asyncio.to_thread(place_cache.get, cache_key)
+    except Exception as e:
+        logger.debug("Place cache read failed: %s", e)
+        return None
+
+async def store_cached_place(place_cache, cache_key, place_data):
+    """Stores a place in the cache off the event loop; a failed write is only logged."""
+    try:
+        await asyncio.to_thread(place_cache.set, cache_key, place_data, expire=PLACE_CACHE_TTL)
+    except Exception as e:
+        logger.debug("Place cache write failed: %s", e)
+
 # --- Helper Functions ---
+async def block_heavy_resources(route):
+    """Route handler that aborts images, media, fonts, photos and map tiles."""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+        return
+    url = request.url
+    if any(marker in url for marker in BLOCKED_URL_MARKERS):
+        await route.abort()
+        return
+    await route.continue_()
+
+async def block_detail_resources(route):
+    """Page route handler for detail pages: aborts stylesheets, defers everything else to the context handler."""
+    if route.request.resource_type in BLOCKED_DETAIL_RESOURCE_TYPES:
+        await route.abort()
+        return
+    await route.fallback()
+
+async def new_detail_page(context):
+    """Opens a page for scraping place details."""
+    page = await context.new_page()
+    await page.route("**/*", block_detail_resources)
+    return page
+
 def create_search_url(query, lang="en", geo_coordinates=None, zoom=None):
     """Creates a Google Maps search URL."""
     params = {'q': query, 'hl': lang}
@@ -38,52 +341,176 @@ def create_search_url(query, lang="en", geo_coordinates=None, zoom=None):
     # For simplicity, starting with basic query search
     return BASE_URL + "?" + urlencode(params)
 
-async def scrape_place_details(context, link, semaphore):
+def canonical_place_key(link):
+    """
+    Key identifying a place link regardless of its query string (?authuser=, hl=, rclk=...) and data= variant.
+    The feature id in the data= segment (!1s0x...:0x...) identifies the place itself; links without one
+    fall back to the whole path, since the name alone does not distinguish same-named places.
+    """
+    match = PLACE_FEATURE_ID_RE.search(link)
+    if match:
+        return match.group(1)
+    return link.split('?', 1)[0]
+
+def add_place_links(place_links, links):
+    """
+    Adds links to the place_links dict (canonical key -> first link seen).
+    Returns True if any of them was a new place.
     """
-    Scrapes details for a single place using a new page from the browser context.
-    Uses a semaphore to limit concurrency.
+    new_links_found = False
+    for link in links:
+        key = canonical_place_key(link)
+        if key not in place_links:
+            place_links[key] = link
+            new_links_found = True
+    return new_links_found
+
+# In-flight place scrapes keyed like the place cache, shared by every search on this event loop
+_inflight_places = {}
+
+async def scrape_place_details(page, link, lang="en"):
+    """
+    Scrapes details for a single place by navigating an already open page.
+    Places extracted within PLACE_CACHE_TTL are served from the on-disk cache without loading the page,
+    and a place already being scraped by another worker or search is awaited instead of loaded twice.
 
     Args:
-        context: Playwright browser context
+        page: Playwright page to reuse for this link
         link (str): URL to the place page
-        semaphore: asyncio.Semaphore for concurrency control
+        lang (str): Language the page is rendered in (part of the cache key)
 
     Returns:
         dict: Place data dictionary
     """
-    async with semaphore:
-        page = await context.new_page()
+    place_cache = get_place_cache()
+    cache_key = (lang, canonical_place_key(link))
+    if place_cache is not None:
+        cached = await get_cached_place(place_cache, cache_key)
+        if cached is not None:
+            logger.info("Using cached details for: %s", link)
+            return dict(cached, link=link)
+
+    inflight = _inflight_places.get(cache_key)
+    if inflight is not None:
+        logger.info("Waiting for in-flight scrape of: %s", link)
+        # Shielded so a cancelled follower does not cancel the shared result
+        place_data = await asyncio.shield(inflight)
+        return dict(place_data, link=link) if place_data else None
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight_places[cache_key] = future
+    place_data = None
+    try:
+        place_data = await _load_place_details(page, link, place_cache, cache_key)
+        return place_data
+    finally:
+        del _inflight_places[cache_key]
+        future.set_result(place_data)
+
+async def _load_place_details(page, link, place_cache, cache_key):
+    """Navigates the page to a place and extracts it, storing the result in the place cache."""
+    try:
+        logger.info("Processing link: %s", link)
+        # Return as soon as the response commits, then wait only for the place heading
+        await page.goto(link, wait_until='commit', timeout=DEFAULT_TIMEOUT)
         try:
-            logger.info(f"Processing link: {link}")
-            await page.goto(link, wait_until='domcontentloaded')
-
-            # Wait for dynamic content to load (rating, reviews, etc.)
-            await asyncio.sleep(random_delay(2.0, 3.0))
+            await page.wait_for_selector(PLACE_READY_SELECTOR, timeout=PLACE_READY_TIMEOUT)
+        except PlaywrightTimeoutError:
+            logger.debug("Place heading not found for %s; extracting what has loaded", link)
 
+        # Wait for dynamic content to load (rating, reviews, etc.) and read the page in one round trip
+        try:
+            snapshot = await page.evaluate(PLACE_HTML_JS, {
+                'detailsSelector': PLACE_DETAILS_SELECTOR,
+                'timeout': PLACE_DETAILS_TIMEOUT,
+            })
+            html_content = snapshot['html']
+            if not snapshot['ready']:
+                logger.debug("No rating rendered for %s; extracting what has loaded", link)
+        except Exception as e:
+            logger.debug("Trimmed serialization failed for %s, using full content: %s", link, e)
             html_content = await page.content()
-            place_data = extractor.extract_place_data(html_content)
+        place_data = await extract_place_data(html_content)
+
+        if place_data:
+            place_data['link'] = link
+            if place_cache is not None:
+                await store_cached_place(place_cache, cache_key, place_data)
+            return place_data
+        else:
+            logger.warning("Failed to extract data for: %s", link)
+            # Optionally save the HTML for debugging
+            # with open(f"error_page_{hash(link)}.html", "w", encoding="utf-8") as f:
+            #     f.write(html_content)
+            return None
 
-            if place_data:
-                place_data['link'] = link
-                return place_data
-            else:
-                logger.warning(f"Failed to extract data for: {link}")
-                # Optionally save the HTML for debugging
-                # with open(f"error_page_{hash(link)}.html", "w", encoding="utf-8") as f:
-                #     f.write(html_content)
-                return None
+    except PlaywrightTimeoutError:
+        logger.warning("Timeout navigating to or processing: %s", link)
+        return None
+    except Exception as e:
+        logger.error("Error processing %s: %s", link, e)
+        return None
+
+async def open_worker_pages(context, count):
+    """Opens the detail pages for the worker pool concurrently."""
+    return await asyncio.gather(*(new_detail_page(context) for _ in range(count)))
+
+async def place_details_worker(page, link_queue, on_result, lang="en"):
+    """
+    Scrapes links from the queue on one reused, already open page until the queue is drained.
+    A fixed number of workers bounds concurrency; each result is passed to on_result as it completes.
+    """
+    replace_page = False
+    try:
+        while not link_queue.empty():
+            link = link_queue.get_nowait()
+            # Replace the page if it crashed, was closed, or timed out on the previous link
+            if replace_page or page.is_closed():
+                page = await new_detail_page(page.context)
+                replace_page = False
+            try:
+                place_data = await asyncio.wait_for(scrape_place_details(page, link, lang), PLACE_SCRAPE_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("Gave up on %s after %ss; replacing its page", link, PLACE_SCRAPE_TIMEOUT)
+                replace_page = True
+                try:
+                    await page.close()
+                except Exception as e:
+                    logger.debug("Error closing timed-out page: %s", e)
+                continue
+            if place_data is not None:
+                on_result(place_data)
+    finally:
+        if not page.is_closed():
+            try:
+                await page.close()
+            except Exception as e:
+                logger.debug("Error closing worker page: %s", e)
 
+async def handle_consent(page):
+    """Accepts (or otherwise dismisses) the Google consent form if one appears."""
+    try:
+        # Prioritize "Accept all" / "Aceptar todo"; the locator click waits briefly for it and clicks in one call
+        try:
+            await page.locator(ACCEPT_CONSENT_XPATH).first.click(timeout=5000)
+            logger.info("Accepted consent form.")
         except PlaywrightTimeoutError:
-            logger.warning(f"Timeout navigating to or processing: {link}")
-            return None
-        except Exception as e:
-            logger.error(f"Error processing {link}: {e}")
-            return None
-        finally:
-            await page.close()
+            # Fallback: any other consent button that is showing
+            fallback_button = page.locator(CONSENT_XPATH).first
+            if not await fallback_button.is_visible():
+                raise
+            logger.info("Clicking available consent button...")
+            await fallback_button.click()
+
+        # Wait for navigation/popup closure
+        await page.wait_for_load_state('networkidle', timeout=5000)
+    except PlaywrightTimeoutError:
+        logger.debug("No consent form detected or timed out waiting.")
+    except Exception as e:
+        logger.warning(f"Error handling consent form: {e}")
 
 # --- Main Scraping Logic ---
-async def scrape_google_maps(query, max_places=None, lang="en", headless=True, concurrency=5):
+async def scrape_google_maps(query, max_places=None, lang="en", headless=True, concurrency=5, on_result=None, details=True):
     """
     Scrapes Google Maps for places based on a query.
 
@@ -93,207 +520,195 @@ async def scrape_google_maps(query, max_places=None, lang="en", headless=True, c
         lang (str, optional): Language code for Google Maps (e.g., 'en', 'es'). Defaults to "en".
         headless (bool, optional): Whether to run the browser in headless mode. Defaults to True.
         concurrency (int, optional): Number of concurrent tabs for scraping details. Defaults to 5.
+        on_result (callable, optional): Called with each place dict as soon as it is scraped.
+              When given, places are streamed to it instead of being collected.
+        details (bool, optional): Open every place page for the full set of fields. When False, places are
+              read from the result cards (name, rating, reviews count, link) and only places without a
+              readable card are opened. Defaults to True.
 
     Returns:
         list: A list of dictionaries, each containing details for a scraped place.
-              Returns an empty list if no places are found or an error occurs.
+              Returns an empty list if no places are found, an error occurs, or on_result is given.
     """
     results = []
-    place_links = set()
-    scroll_attempts_no_new = 0
-    browser = None
+    scraped_count = 0
+
+    def emit(place_data):
+        nonlocal scraped_count
+        scraped_count += 1
+        if on_result is not None:
+            on_result(place_data)
+        else:
+            results.append(place_data)
+
+    place_links = {}  # canonical key -> link, so URL variants of one place are fetched once
+    context = None
+    worker_pages = None
+
+    try:
+        # The browser is shared across calls; each call gets its own isolated context
+        context = await new_browser_context(
+            headless,
+            user_agent=random.choice(USER_AGENTS),  # Random user agent for anti-detection
+            java_script_enabled=True,
+            accept_downloads=False,
+            locale=lang,
+        )
+        # Applies to the search page and every pooled detail page
+        await context.route("**/*", block_heavy_resources)
+        
+        # --- Step 1: Navigate to Google Maps and perform search ---
+        page = await context.new_page()
+        if not page:
+            raise Exception("Failed to create a new browser page (context.new_page() returned None).")
+
+        # Navigate to Google Maps homepage first (more natural, avoids sidebar issues)
+        logger.info("Navigating to Google Maps homepage...")
+        await page.goto('https://www.google.com/maps', wait_until='domcontentloaded')
+        await asyncio.sleep(random_delay(3.0, 5.0))  # Give page time to fully load
 
-    async with async_playwright() as p:
+        # Find and use the search box
+        logger.info(f"Typing search query: {query}")
         try:
-            browser = await p.chromium.launch(
-                headless=headless,
-                args=[
-                    '--disable-dev-shm-usage',  # Use /tmp instead of /dev/shm for shared memory
-                    '--no-sandbox',  # Required for running in Docker
-                    '--disable-setuid-sandbox',
-                ]
-            )
-            context = await browser.new_context(
-                user_agent=random.choice(USER_AGENTS),  # Random user agent for anti-detection
-                java_script_enabled=True,
-                accept_downloads=False,
-                locale=lang,
-            )
-            
-            # --- Step 1: Navigate to Google Maps and perform search ---
-            page = await context.new_page()
-            if not page:
-                await browser.close()
-                raise Exception("Failed to create a new browser page (context.new_page() returned None).")
-
-            # Navigate to Google Maps homepage first (more natural, avoids sidebar issues)
-            logger.info("Navigating to Google Maps homepage...")
-            await page.goto('https://www.google.com/maps', wait_until='domcontentloaded')
-            await asyncio.sleep(random_delay(3.0, 5.0))  # Give page time to fully load
-
-            # Find and use the search box
-            logger.info(f"Typing search query: {query}")
+            # One wait for whichever search box variant renders (Google Maps changes frequently)
             try:
-                # Try multiple search box selectors (Google Maps changes frequently)
-                search_box_selectors = [
-                    'input[id="searchboxinput"]',
-                    'input[aria-label*="Search"]',
-                    'input[placeholder*="Search"]',
-                    'input[name="q"]',
-                ]
-
-                search_box = None
-                for selector in search_box_selectors:
-                    try:
-                        await page.wait_for_selector(selector, state='visible', timeout=5000)
-                        search_box = selector
-                        logger.debug(f"Found search box with selector: {selector}")
-                        break
-                    except:
-                        continue
-
-                if not search_box:
-                    logger.error("Could not find search box on Google Maps")
-                    await browser.close()
-                    return []
-
-                # Type the query into the search box
-                await page.fill(search_box, query)
-                await asyncio.sleep(random_delay(0.5, 1.0))
-
-                # Press Enter to submit search
-                await page.keyboard.press('Enter')
-                logger.info("Search submitted, waiting for results...")
-                await asyncio.sleep(random_delay(3.0, 4.0))
-
-            except Exception as e:
-                logger.error(f"Error performing search: {e}")
-                await browser.close()
+                search_box = await page.wait_for_selector(SEARCH_BOX_SELECTOR, state='visible', timeout=SEARCH_BOX_TIMEOUT)
+            except PlaywrightTimeoutError:
+                logger.error("Could not find search box on Google Maps")
                 return []
 
-            # --- Handle potential consent forms ---
-            try:
-                # Expanded consent xpath to include Spanish and input elements (from PR #7)
-                consent_xpath = "//button[.//span[contains(text(), 'Accept all') or contains(text(), 'Reject all') or contains(text(), 'Aceptar todo') or contains(text(), 'Rechazar todo') or contains(text(), 'Accept')]] | //input[@type='submit' and (@value='Accept all' or @value='Reject all' or @value='Aceptar todo' or @value='Rechazar todo')]"
-
-                # Wait briefly for the button to potentially appear
-                await page.wait_for_selector(consent_xpath, state='visible', timeout=5000)
-
-                # Prioritize "Accept all" / "Aceptar todo"
-                accept_button = await page.query_selector("//button[.//span[contains(text(), 'Accept all') or contains(text(), 'Aceptar todo')]] | //input[@type='submit' and (@value='Accept all' or @value='Aceptar todo')]")
-                if accept_button:
-                    logger.info("Accepting consent form...")
-                    await accept_button.click()
-                else:
-                    # Fallback
-                    logger.info("Clicking available consent button...")
-                    await page.locator(consent_xpath).first.click()
+            # Type the query into the search box
+            await search_box.fill(query)
+            await asyncio.sleep(random_delay(0.5, 1.0))
 
-                # Wait for navigation/popup closure
-                await page.wait_for_load_state('networkidle', timeout=5000)
-            except PlaywrightTimeoutError:
-                logger.debug("No consent form detected or timed out waiting.")
-            except Exception as e:
-                logger.warning(f"Error handling consent form: {e}")
+            # Press Enter to submit search; the consent/feed waits below cover result loading
+            await page.keyboard.press('Enter')
+            logger.info("Search submitted, waiting for results...")
 
+            # Warm the detail page pool while the results load and scroll
+            if details:
+                worker_count = min(concurrency, max_places) if max_places else concurrency
+                worker_pages = asyncio.create_task(open_worker_pages(context, worker_count))
 
-            # --- Scrolling and Link Extraction ---
-            logger.info("Scrolling to load places...")
-            feed_selector = '[role="feed"]'
-            found_feed = False
-
-            # Attempt to find feed with fallbacks (from PR #7)
-            try:
-                await page.wait_for_selector(feed_selector, state='visible', timeout=10000)
-                found_feed = True
-            except PlaywrightTimeoutError:
-                logger.info(f"Primary feed selector '{feed_selector}' not found. Checking fallbacks...")
+        except Exception as e:
+            logger.error(f"Error performing search: {e}")
+            return []
+
+        # --- Handle potential consent forms while waiting for the results feed ---
+        # Both waits run at once; if the feed shows up first there is no consent form to handle.
+        feed_selector = '[role="feed"]'
+        found_feed = False
+        consent_task = asyncio.create_task(handle_consent(page))
+        feed_task = asyncio.create_task(
+            page.wait_for_selector(feed_selector, state='visible', timeout=FEED_TIMEOUT))
+        await asyncio.wait({consent_task, feed_task}, return_when=asyncio.FIRST_COMPLETED)
+        if feed_task.done() and feed_task.exception() is None:
+            consent_task.cancel()
+        # asyncio.wait absorbs only the consent task's own cancellation; if this scrape
+        # is cancelled (e.g. the API timeout), the CancelledError still propagates
+        await asyncio.wait({consent_task})
+
+        # --- Scrolling and Link Extraction ---
+        logger.info("Scrolling to load places...")
+
+        # Attempt to find feed with fallbacks (from PR #7)
+        try:
+            await feed_task
+            found_feed = True
+        except PlaywrightTimeoutError:
+            logger.info(f"Primary feed selector '{feed_selector}' not found. Checking fallbacks...")
 
-            if not found_feed:
-                # Check if it's a single result page (maps/place/)
-                if "/maps/place/" in page.url:
-                    logger.info("Detected single place page.")
-                    place_links.add(page.url)
+        if not found_feed:
+            # Check if it's a single result page (maps/place/)
+            if "/maps/place/" in page.url:
+                logger.info("Detected single place page.")
+                add_place_links(place_links, [page.url])
+            else:
+                # Try to find place links directly (PR #7 fallback)
+                links = await page.evaluate(PLACE_LINKS_JS)
+                if links:
+                    logger.info(f"Found {len(links)} place links directly without feed selector.")
+                    add_place_links(place_links, links)
+                    # We won't be able to scroll effectively, but we have visible links
                 else:
-                    # Try to find place links directly (PR #7 fallback)
-                    links = await page.locator('a[href*="/maps/place/"]').evaluate_all('elements => elements.map(a => a.href)')
-                    if links:
-                        logger.info(f"Found {len(links)} place links directly without feed selector.")
-                        place_links.update(links)
-                        # We won't be able to scroll effectively, but we have visible links
-                    else:
-                        logger.error(f"Error: Feed element not found. Page content may be unexpected.")
-                        await browser.close()
-                        return []
-
-            if found_feed and await page.locator(feed_selector).count() > 0:
-                last_height = await page.evaluate(f'document.querySelector(\'{feed_selector}\').scrollHeight')
-                while True:
-                    # Scroll down
-                    await page.evaluate(f'document.querySelector(\'{feed_selector}\').scrollTop = document.querySelector(\'{feed_selector}\').scrollHeight')
-                    await asyncio.sleep(random_delay(1.0, 2.0))  # Random delay for anti-detection
-
-                    # Extract links after scroll
-                    current_links_list = await page.locator(f'{feed_selector} a[href*="/maps/place/"]').evaluate_all('elements => elements.map(a => a.href)')
-                    current_links = set(current_links_list)
-                    new_links_found = len(current_links - place_links) > 0
-                    place_links.update(current_links)
-                    logger.info(f"Found {len(place_links)} unique place links so far...")
-
-                    if max_places is not None and len(place_links) >= max_places:
-                        logger.info(f"Reached max_places limit ({max_places}).")
-                        place_links = set(list(place_links)[:max_places]) # Trim excess links
-                        break
-
-                    # Check if scroll height has changed
-                    new_height = await page.evaluate(f'document.querySelector(\'{feed_selector}\').scrollHeight')
-                    if new_height == last_height:
-                        # Check for the "end of results" marker
-                        # Check for end marker in multiple languages (PR #7)
-                        end_marker_xpath = "//span[contains(text(), \"You've reached the end of the list.\") or contains(text(), \"Has llegado al final de la lista\")]"
-                        if await page.locator(end_marker_xpath).count() > 0:
-                            logger.info("Reached the end of the results list.")
-                            break
-                        else:
-                            # If height didn't change but end marker isn't there, maybe loading issue?
-                            if not new_links_found:
-                                scroll_attempts_no_new += 1
-                                logger.debug(f"Scroll height unchanged and no new links. Attempt {scroll_attempts_no_new}/{MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS}")
-                                if scroll_attempts_no_new >= MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS:
-                                    logger.info("Stopping scroll due to lack of new links.")
-                                    break
-                            else:
-                                scroll_attempts_no_new = 0 # Reset if new links were found this cycle
-                    else:
-                        last_height = new_height
-                        scroll_attempts_no_new = 0 # Reset if scroll height changed
-
-            # Close the search page as we have the links now
-            await page.close()
-
-            # --- Step 2: Scraping Individual Places in Parallel ---
-            logger.info(f"Scraping details for {len(place_links)} places with concurrency {concurrency}...")
-
-            semaphore = asyncio.Semaphore(concurrency)
-            tasks = [scrape_place_details(context, link, semaphore)
-                     for link in place_links]
-            
-            # Run tasks and gather results
-            scraped_results = await asyncio.gather(*tasks)
-            
-            # Filter out None results (failed scrapes)
-            results = [r for r in scraped_results if r is not None]
-
-            await browser.close()
+                    logger.error(f"Error: Feed element not found. Page content may be unexpected.")
+                    return []
 
-        except PlaywrightTimeoutError:
-            logger.error(f"Timeout error during scraping process.")
-        except Exception as e:
-            logger.error(f"An error occurred during scraping: {e}", exc_info=True)
-        finally:
-            # Ensure browser is closed if an error occurred mid-process
-            if browser and browser.is_connected():
-                await browser.close()
+        if found_feed:
+            # The page scrolls itself and reports back once, instead of one round trip per scroll
+            scroll_result = await page.evaluate(AUTO_SCROLL_JS, {
+                'selector': feed_selector,
+                'maxPlaces': max_places,
+                'maxStalls': MAX_SCROLL_ATTEMPTS_WITHOUT_NEW_LINKS,
+                'growthTimeout': FEED_GROWTH_TIMEOUT,
+                'endMarkerXPath': END_MARKER_XPATH,
+            })
+            add_place_links(place_links, scroll_result['links'])
+            logger.info(f"Found {len(place_links)} unique place links.")
+
+            stop_reason = scroll_result['reason']
+            if stop_reason == 'max_places':
+                logger.info(f"Reached max_places limit ({max_places}).")
+            elif stop_reason == 'end':
+                logger.info("Reached the end of the results list.")
+            elif stop_reason == 'missing':
+                logger.warning("Feed element disappeared while scrolling.")
+            else:
+                logger.info("Stopping scroll due to lack of new links.")
+
+            if max_places is not None and len(place_links) > max_places:
+                place_links = dict(itertools.islice(place_links.items(), max_places)) # Trim excess links, keeping discovery order
+
+            if not details:
+                # List-only: take what the cards show and open just the places without a readable card
+                cards = await page.evaluate(FEED_CARDS_JS, feed_selector)
+                card_by_key = {canonical_place_key(card['link']): card for card in cards}
+                for key in list(place_links):
+                    card = card_by_key.get(key)
+                    place_data = extractor.parse_feed_card(card) if card is not None else None
+                    if place_data is not None:
+                        emit(place_data)
+                        del place_links[key]
+                logger.info(f"Read {scraped_count} places from result cards.")
+
+        # Close the search page as we have the links now
+        await page.close()
+
+        # --- Step 2: Scraping Individual Places in Parallel ---
+        logger.info(f"Scraping details for {len(place_links)} places with concurrency {concurrency}...")
+
+        # One worker per warm page drains the link queue; pages beyond the number of
+        # links are closed unused. Failed scrapes return None and are never appended
+        link_queue = asyncio.Queue()
+        for link in place_links.values():
+            link_queue.put_nowait(link)
+        if worker_pages is None:
+            worker_pages = asyncio.create_task(open_worker_pages(context, min(concurrency, len(place_links))))
+        pages = await worker_pages
+        for spare_page in pages[len(place_links):]:
+            await spare_page.close()
+        workers = [place_details_worker(worker_page, link_queue, emit, lang)
+                   for worker_page in pages[:len(place_links)]]
+        await asyncio.gather(*workers)
+
+    except PlaywrightTimeoutError:
+        logger.error(f"Timeout error during scraping process.")
+    except Exception as e:
+        logger.error(f"An error occurred during scraping: {e}", exc_info=True)
+    finally:
+        # An early return can leave the page pool still opening; its pages close with the context
+        if worker_pages is not None and not worker_pages.done():
+            worker_pages.cancel()
+            try:
+                await worker_pages
+            except (asyncio.CancelledError, Exception):
+                pass
+        # Only the per-call context is closed; the shared browser stays up for the next query
+        if context is not None:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser context: {e}")
 
-    logger.info(f"Scraping finished. Found details for {len(results)} places.")
+    logger.info(f"Scraping finished. Found details for {scraped_count} places.")
     return results
\ No newline at end of file
@@ -7,6 +7,11 @@ setup(
     install_requires=[
         "playwright",
         "fastapi",
-        "uvicorn[standard]"
+        "uvicorn[standard]",
+        "selectolax",
+        "google-re2",
+        "orjson",
+        "pysimdjson",
+        "diskcache",
     ],
 )
\ No newline at end of file
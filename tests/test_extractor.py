@@ -0,0 +1,46 @@
+from gmaps_scraper_server.extractor import extract_place_data, get_main_name, parse_feed_card, parse_html_tree
+
+
+def test_bare_google_maps_title_falls_through_to_h1():
+    html = '<html><head><title>Google Maps</title></head><body><h1><span>Real Cafe</span></h1></body></html>'
+    assert get_main_name(html, None, parse_html_tree(html)) == 'Real Cafe'
+    assert extract_place_data(html)['name'] == 'Real Cafe'
+
+
+def test_bare_google_maps_title_without_h1_has_no_name():
+    html = '<html><head><title>Google Maps</title></head><body></body></html>'
+    assert get_main_name(html, None, parse_html_tree(html)) is None
+
+
+def test_place_title_strips_suffix():
+    html = '<html><head><title>Joe &amp; Co - Google Maps</title></head></html>'
+    assert get_main_name(html, None, parse_html_tree(html)) == 'Joe & Co'
+
+
+def test_feed_card_localized_rating_and_category():
+    card = {
+        'link': 'https://www.google.com/maps/place/x',
+        'name': 'Café Central',
+        'rating_label': '4,5 Sterne 1.234 Rezensionen',
+        'text': 'Café Central\n4,5(1.234)\nCafé · Herrengasse 14\nGeöffnet ⋅ Schließt um 22:00',
+    }
+    assert parse_feed_card(card) == {
+        'name': 'Café Central',
+        'rating': 4.5,
+        'reviews_count': 1234,
+        'categories': ['Café'],
+        'link': 'https://www.google.com/maps/place/x',
+    }
+
+
+def test_feed_card_mixed_separators():
+    card = {'link': 'L', 'name': 'Joe', 'rating_label': '4.5 stars 1.234 reviews', 'text': ''}
+    assert parse_feed_card(card) == {'name': 'Joe', 'rating': 4.5, 'reviews_count': 1234, 'link': 'L'}
+
+
+def test_cached_result_is_not_shared_with_callers():
+    html = ('<html><head><title>Deep Copy Diner - Google Maps</title></head>'
+            '<body><button aria-label="Category: Diner"></button></body></html>')
+    first = extract_place_data(html)
+    first['categories'].append('Mutated')
+    assert extract_place_data(html)['categories'] == ['Diner']